@@ -142,7 +142,7 @@ def init(authorization: Optional[AuthenticationBackend] = None) -> Starlette:
         Middleware(CORSMiddleware, allow_origins=[cors]),
     ]
     if authorization:
-        logger.warning(f"Using custom authorization backend: {type(authorization)}")
+        logger.warning("Using custom authorization backend: %s", type(authorization))
         middleware.append(Middleware(AuthenticationMiddleware, backend=authorization))
     else:
         middleware.append(
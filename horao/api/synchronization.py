@@ -62,23 +62,25 @@ async def synchronize(request: Request) -> JSONResponse:
         "500":
           description: Error synchronizing
     """
-    logging.debug(f"Calling Synchronize ({request})")
+    logging.debug("Calling Synchronize (%s)", request)
     try:
         data = await request.json()
         logical_infrastructure = json.loads(data, cls=HoraoDecoder)
     except Exception as e:
-        logging.error(f"Error parsing request: {e}")
-        if os.getenv("DEBUG", "False") == "True":
+        debug = os.getenv("DEBUG", "False") == "True"
+        logging.error("Error parsing request: %s", e, exc_info=debug)
+        if debug:
             return JSONResponse(
                 status_code=400, content={"error": f"Error parsing request {str(e)}"}
             )
         return JSONResponse(status_code=400, content={"error": "Error parsing request"})
     try:
         session = init_session()
-        session.save_logical_infrastructure(logical_infrastructure)
+        await session.save_logical_infrastructure(logical_infrastructure)
     except Exception as e:
-        logging.error(f"Error synchronizing: {e}")
-        if os.getenv("DEBUG", "False") == "True":
+        debug = os.getenv("DEBUG", "False") == "True"
+        logging.error("Error synchronizing: %s", e, exc_info=debug)
+        if debug:
             return JSONResponse(
                 status_code=500, content={"error": f"Error synchronizing {str(e)}"}
             )
@@ -59,7 +59,7 @@ async def get_reservations(request: Request) -> JSONResponse:
         "500":
           description: Error processing request
     """
-    logging.debug(f"Calling Reservations ({request})")
+    logging.debug("Calling Reservations (%s)", request)
     try:
         session = init_session()
         logical_infrastructure = await session.load_logical_infrastructure()
@@ -71,8 +71,9 @@ async def get_reservations(request: Request) -> JSONResponse:
             status_code=200, content={"claims": json.dumps(claims, cls=HoraoEncoder)}
         )
     except Exception as e:
-        logging.error(f"Error processing request: {e}")
-        if os.getenv("DEBUG", "False") == "True":
+        debug = os.getenv("DEBUG", "False") == "True"
+        logging.error("Error processing request: %s", e, exc_info=debug)
+        if debug:
             return JSONResponse(
                 status_code=500, content={"error": f"Error processing request {str(e)}"}
             )
@@ -132,13 +133,14 @@ async def create_reservation(request: Request) -> JSONResponse:
         "500":
           description: Error processing reservation
     """
-    logging.debug(f"Creating Reservation ({request})")
+    logging.debug("Creating Reservation (%s)", request)
     try:
         data = await request.json()
         claim = json.loads(data, cls=HoraoDecoder)
     except Exception as e:
-        logging.error(f"Error parsing request: {e}")
-        if os.getenv("DEBUG", "False") == "True":
+        debug = os.getenv("DEBUG", "False") == "True"
+        logging.error("Error parsing request: %s", e, exc_info=debug)
+        if debug:
             return JSONResponse(
                 status_code=400, content={"error": f"Error parsing request {str(e)}"}
             )
@@ -150,8 +152,9 @@ async def create_reservation(request: Request) -> JSONResponse:
         user = request.user
         start = scheduler.schedule(claim, user.tenant)
     except Exception as e:
-        logging.error(f"Error processing request: {e}")
-        if os.getenv("DEBUG", "False") == "True":
+        debug = os.getenv("DEBUG", "False") == "True"
+        logging.error("Error processing request: %s", e, exc_info=debug)
+        if debug:
             return JSONResponse(
                 status_code=500, content={"error": f"Error processing request {str(e)}"}
             )
@@ -6,7 +6,9 @@ Digest authentication using pre-shared key.
 import binascii
 import logging
 import os
-from typing import Tuple, Union
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import jwt
 from authlib.integrations.starlette_client import OAuth  # type: ignore
@@ -19,6 +21,7 @@ from starlette.authentication import (
 from starlette.requests import HTTPConnection
 
 from horao.auth.roles import Administrator, Peer, User
+from horao.persistance.store import Store
 
 
 class MultiAuthBackend(AuthenticationBackend):
@@ -42,19 +45,68 @@ class MultiAuthBackend(AuthenticationBackend):
         ),
     }
 
-    def digest_authentication(
+    def __init__(self) -> None:
+        """
+        Initialize the backend, the list of known peers is read once from PEERS,
+        the OAuth client is registered on first use.
+        """
+        peers = os.getenv("PEERS")
+        self.peers: List[str] = peers.split(",") if peers else []
+        self.oauth_client: Optional[Any] = None
+        self.seen_tokens: Dict[str, float] = {}
+        self.seen_tokens_size = int(os.getenv("PEER_TOKEN_CACHE_SIZE", 100000))
+        self.seen_tokens_lock = threading.Lock()
+        redis_url = os.getenv("REDIS_URL")
+        self.store: Optional[Store] = Store(redis_url) if redis_url else None
+
+    async def register_token(self, jti: str, expires: float) -> bool:
+        """
+        Register a peer token id, tokens are only accepted once until they expire.
+        Seen token ids are shared through redis if REDIS_URL is set, otherwise
+        they are kept in process memory, when that cache is full tokens are rejected.
+        :param jti: unique token id
+        :param expires: expiry of the token (seconds since epoch)
+        :return: True if the token was not seen before, False on replay or full cache
+        """
+        if self.store:
+            return await self.store.async_claim(f"peer-token-{jti}", expires)
+        now = time.time()
+        with self.seen_tokens_lock:
+            while self.seen_tokens and next(iter(self.seen_tokens.values())) < now:
+                del self.seen_tokens[next(iter(self.seen_tokens))]
+            if jti in self.seen_tokens:
+                return False
+            if len(self.seen_tokens) >= self.seen_tokens_size:
+                self.seen_tokens = {
+                    k: v for k, v in self.seen_tokens.items() if v >= now
+                }
+                if len(self.seen_tokens) >= self.seen_tokens_size:
+                    self.logger.error(
+                        "Peer token cache is full (%s entries), rejecting token",
+                        self.seen_tokens_size,
+                    )
+                    return False
+            self.seen_tokens[jti] = expires
+            return True
+
+    async def digest_authentication(
         self, conn: HTTPConnection, token: str
     ) -> Union[None, Tuple[AuthCredentials, BaseUser]]:
         host = conn.client.host  # type: ignore
-        peer_match_source = False
-        for peer in os.getenv("PEERS").split(","):  # type: ignore
-            if peer in host:
-                self.logger.debug(f"Peer {peer} is trying to authenticate")
-                peer_match_source = True
-        if not peer_match_source and os.getenv("PEER_STRICT", "True") == "True":
+        peer = next((p for p in self.peers if p in host), None)
+        if peer:
+            self.logger.debug("Peer %s is trying to authenticate", peer)
+        elif os.getenv("PEER_STRICT", "True") == "True":
             raise AuthenticationError(f"access not allowed for {host}")
-        payload = jwt.decode(token, os.getenv("PEER_SECRET"), algorithms=["HS256"])  # type: ignore
-        self.logger.debug(f"valid token for {payload['peer']}")
+        payload = jwt.decode(
+            token,
+            os.getenv("PEER_SECRET"),  # type: ignore
+            algorithms=["HS256"],
+            options={"require": ["exp", "jti"]},
+        )
+        if not await self.register_token(payload["jti"], payload["exp"]):
+            raise AuthenticationError(f"token rejected for {host}")
+        self.logger.debug("valid token for %s", payload["peer"])
         return AuthCredentials(["authenticated"]), Peer(
             identity=payload["peer"],
             token=token,
@@ -65,13 +117,13 @@ class MultiAuthBackend(AuthenticationBackend):
     async def oauth_authentication(
         self, conn: HTTPConnection
     ) -> Union[None, Tuple[AuthCredentials, BaseUser]]:
-        oauth = OAuth()
-        filtered_settings = {
-            k: v for k, v in self.oauth_settings.items() if v is not None
-        }
-        client = oauth.register(filtered_settings)
+        if self.oauth_client is None:
+            filtered_settings = {
+                k: v for k, v in self.oauth_settings.items() if v is not None
+            }
+            self.oauth_client = OAuth().register(filtered_settings)
         token = conn.headers["Authorization"]
-        user = await client.authorize_access_token(token)
+        user = await self.oauth_client.authorize_access_token(token)
         if not user:
             raise AuthenticationError(f"Authentication failed for {conn.client.host}")  # type: ignore
         role = user.get(self.oauth_role_uri, "user")
@@ -95,14 +147,14 @@ class MultiAuthBackend(AuthenticationBackend):
                 scheme, token = auth.split()
                 if scheme.lower() != "bearer":
                     return None
-                return self.digest_authentication(conn, token)
+                return await self.digest_authentication(conn, token)
             except (
                 ValueError,
                 UnicodeDecodeError,
                 jwt.InvalidTokenError,
                 binascii.Error,
             ) as exc:
-                self.logger.error(f"Invalid token for peer ({exc})")
+                self.logger.error("Invalid token for peer (%s)", exc)
                 raise AuthenticationError(f"access not allowed for {conn.client.host}")  # type: ignore
         else:
             return await self.oauth_authentication(conn)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABC
 from enum import Enum, auto
-from typing import Dict, TypeVar
+from typing import Dict, FrozenSet, TypeVar
 
 RT = TypeVar("RT")
 
@@ -25,9 +25,19 @@ class Permission(Enum):
 
 
 class Permissions(ABC):
+    __slots__ = ("name", "permissions", "readable", "writable")
+
     def __init__(self, name: str, permissions: Dict[Namespace, Permission]):
         self.name = name
         self.permissions: Dict[Namespace, Permission] = permissions
+        self.readable: FrozenSet[Namespace] = frozenset(
+            n
+            for n, p in permissions.items()
+            if p in (Permission.Read, Permission.Write)
+        )
+        self.writable: FrozenSet[Namespace] = frozenset(
+            n for n, p in permissions.items() if p is Permission.Write
+        )
 
     def __len__(self):
         return len(self.permissions.keys())
@@ -40,20 +50,15 @@ class Permissions(ABC):
             yield permission
 
     def can_read(self, namespace: Namespace):
-        if namespace not in self.permissions.keys():
-            return False
-        return (
-            self.permissions[namespace] == Permission.Read
-            or self.permissions[namespace] == Permission.Write
-        )
+        return namespace in self.readable
 
     def can_write(self, namespace: Namespace):
-        if namespace not in self.permissions.keys():
-            return False
-        return self.permissions[namespace] == Permission.Write
+        return namespace in self.writable
 
 
 class AdministratorPermissions(Permissions):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "System Administrator",
@@ -65,6 +70,8 @@ class AdministratorPermissions(Permissions):
 
 
 class PeerPermissions(Permissions):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Peer Node",
@@ -76,6 +83,8 @@ class PeerPermissions(Permissions):
 
 
 class TenantPermissions(Permissions):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "TenantOwner",
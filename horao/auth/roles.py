@@ -12,6 +12,11 @@ from horao.auth.permissions import (
 )
 from horao.conceptual.tenant import Tenant
 
+# permission sets are never modified, so every user of a role shares one instance
+_administrator_permissions = AdministratorPermissions()
+_peer_permissions = PeerPermissions()
+_tenant_permissions = TenantPermissions()
+
 
 class User(BaseUser):
     def __init__(self, name: str) -> None:
@@ -58,7 +63,7 @@ class Peer(User):
 
     @property
     def permissions(self) -> List[Permissions]:
-        return [PeerPermissions()]
+        return [_peer_permissions]
 
     def __str__(self) -> str:
         return f"{self.origin} -> {self.name}"
@@ -71,7 +76,7 @@ class TenantController(User):
 
     @property
     def permissions(self) -> List[Permissions]:
-        return [TenantPermissions()]
+        return [_tenant_permissions]
 
 
 class Administrator(User):
@@ -84,4 +89,4 @@ class Administrator(User):
 
     @property
     def permissions(self) -> List[Permissions]:
-        return [AdministratorPermissions()]
+        return [_administrator_permissions]
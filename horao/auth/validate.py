@@ -29,13 +29,15 @@ def permission_required(
                     if not arg.user:
                         raise UnauthorizedError(func, *args, **kwargs)
                     if isinstance(arg.user, User):
-                        if permission.Write and any(
-                            [p for p in arg.user.permissions if p.can_write(namespace)]
-                        ):
-                            return await func(*args, **kwargs)
-                        if permission.Read and any(
-                            [p for p in arg.user.permissions if p.can_read(namespace)]
-                        ):
+                        if permission is Permission.Write:
+                            allowed = any(
+                                p.can_write(namespace) for p in arg.user.permissions
+                            )
+                        else:
+                            allowed = any(
+                                p.can_read(namespace) for p in arg.user.permissions
+                            )
+                        if allowed:
                             return await func(*args, **kwargs)
             raise UnauthorizedError(func, *args, **kwargs)
 
@@ -163,23 +163,18 @@ class Reservation(Claim):
         if maximal and not self.maximal_resources:
             raise ValueError("No maximal resources defined")
         resources = self.maximal_resources if maximal else self.resources
-        claim_compute_cpu = sum(
-            [c.cpu * c.amount for c in resources if isinstance(c, Compute)]
-        )
-        claim_compute_ram = sum(
-            [c.ram * c.amount for c in resources if isinstance(c, Compute)]
-        )
-        claim_compute_accelerator = sum(
-            [c.amount for c in resources if isinstance(c, Compute) and c.accelerator]
-        )
-        claim_storage_block = sum(
-            [
-                s.amount
-                for s in resources
-                if isinstance(s, Storage)
-                if s.storage_type is StorageType.Block
-            ]
-        )
+        claim_compute_cpu = 0
+        claim_compute_ram = 0
+        claim_compute_accelerator = 0
+        claim_storage_block = 0
+        for r in resources:
+            if isinstance(r, Compute):
+                claim_compute_cpu += r.cpu * r.amount
+                claim_compute_ram += r.ram * r.amount
+                if r.accelerator:
+                    claim_compute_accelerator += r.amount
+            elif isinstance(r, Storage) and r.storage_type is StorageType.Block:
+                claim_storage_block += r.amount
         return (
             claim_compute_cpu,
             claim_compute_ram,
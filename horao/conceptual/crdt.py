@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import (
     Callable,
     Dict,
@@ -10,6 +11,7 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    Mapping,
     Optional,
     Set,
     Tuple,
@@ -82,7 +84,7 @@ class ObservedRemovedSet(CRDT):
 
         self.invoke_listeners(state_update)
 
-        if state_update.update_type == UpdateType.Observed:
+        if state_update.update_type is UpdateType.Observed:
             if state_update.data not in self.removed or (
                 state_update.data in self.removed_metadata
                 and not self.clock.is_later(
@@ -98,7 +100,7 @@ class ObservedRemovedSet(CRDT):
 
                 self.cache = None
 
-        if state_update.update_type == UpdateType.Removed:
+        if state_update.update_type is UpdateType.Removed:
             if state_update.data not in self.removed or (
                 state_update.data in self.removed_metadata
                 and self.clock.is_later(
@@ -504,17 +506,19 @@ class LastWriterWinsMap(CRDT):
         self.registers = registers
         self.clock = clock
         self.listeners = listeners
+        self.cache: Optional[dict] = None
 
-    def read(self) -> dict:
+    def read(self) -> Mapping:
         """
-        Return the eventually consistent data view.
-        :return: dict
+        Return the eventually consistent data view, cached until the next update.
+        :return: read-only view of the map
         """
-        result = {}
-        for name in self.names.read():
-            if name in self.registers:
-                result[name] = self.registers[name].read()
-        return result
+        if self.cache is None:
+            self.cache = {}
+            for name in self.names.read():
+                if name in self.registers:
+                    self.cache[name] = self.registers[name].read()
+        return MappingProxyType(self.cache)
 
     def update(self, state_update: Update) -> LastWriterWinsMap:
         """
@@ -528,7 +532,8 @@ class LastWriterWinsMap(CRDT):
             raise ValueError("state_update.clock_uuid must equal CRDT.clock.uuid")
 
         self.invoke_listeners(state_update)
-        if state_update.update_type == UpdateType.Observed:
+        self.cache = None
+        if state_update.update_type is UpdateType.Observed:
             self.names.update(
                 Update(
                     clock_uuid=self.clock.uuid,
@@ -551,7 +556,7 @@ class LastWriterWinsMap(CRDT):
                     state_update.writer,
                 )
 
-        if state_update.update_type == UpdateType.Removed:
+        if state_update.update_type is UpdateType.Removed:
             self.names.update(
                 Update(
                     self.clock.uuid,
@@ -765,6 +770,7 @@ class CRDTList(List[T]):
         self.log = logging.getLogger(__name__)
         self.listeners = listeners if listeners else []
         self.changes: List[Update] = []
+        self.change_set: Set[Update] = set()
         self.items = (
             LastWriterWinsMap(listeners=[self.invoke_listeners]) if not items else items
         )
@@ -795,7 +801,8 @@ class CRDTList(List[T]):
         Invokes all event listeners.
         :return: None
         """
-        if update and not update in self.changes:
+        if update and update not in self.change_set:
+            self.change_set.add(update)
             self.changes.append(update)
         for listener in self.listeners:
             listener(self.changes)
@@ -806,6 +813,7 @@ class CRDTList(List[T]):
         :return: None
         """
         self.changes.clear()
+        self.change_set.clear()
 
     @instrument_class_function(name="append", level=logging.DEBUG)
     def append(self, item: T) -> T:
@@ -847,7 +855,7 @@ class CRDTList(List[T]):
                 continue
             if self.items.read()[i] == item:
                 return i
-        self.log.error(f"{item} not found.")
+        self.log.error("%s not found.", item)
         raise ValueError(f"{item} not found.")
 
     def insert(self, index: int, item: T) -> None:  # type: ignore
@@ -856,7 +864,7 @@ class CRDTList(List[T]):
     @instrument_class_function(name="pop", level=logging.DEBUG)
     def pop(self, index: int, default=None) -> Optional[T]:
         if index >= len(self):
-            self.log.debug(f"Index {index} out of bounds, returning default.")
+            self.log.debug("Index %s out of bounds, returning default.", index)
             return default
         item = self.items.read()[index]
         self.items.unset(item, hash(item))
@@ -875,7 +883,7 @@ class CRDTList(List[T]):
             None,
         )
         if not local_item:
-            self.log.debug(f"{item} not found.")
+            self.log.debug("%s not found.", item)
             raise ValueError(f"{item} not found.")
         self.items.unset(local_item, hash(item))
 
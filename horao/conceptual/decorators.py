@@ -2,7 +2,10 @@
 """Decorator functions for the application model implementation."""
 import inspect
 import logging
+import os
+import time
 from functools import wraps
+from typing import Optional
 
 from opentelemetry import trace
 
@@ -10,31 +13,69 @@ from opentelemetry import trace
 def instrument_class_function(
     name: str,
     level: int = logging.INFO,
+    slow_call_threshold: Optional[float] = None,
 ):
     """
     Decorator to instrument a class method with logging and tracing.
+    Calls that take longer than the slow call threshold are logged as a warning,
+    coroutine functions are timed until they complete.
     :param name: name of the tracer
     :param level: logging level to use for tracer
+    :param slow_call_threshold: threshold in seconds, defaults to SLOW_CALL_THRESHOLD (0, disabled)
     :return: function
     """
     t = trace.get_tracer_provider().get_tracer(name)
+    threshold = (
+        slow_call_threshold
+        if slow_call_threshold is not None
+        else float(os.getenv("SLOW_CALL_THRESHOLD", 0))
+    )
 
     def inner(func):
+        logger = logging.getLogger(func.__module__)
+
+        def log_slow_call(start: float) -> None:
+            elapsed = time.perf_counter() - start
+            if threshold and elapsed > threshold:
+                logger.warning(
+                    "Slow call %s took %.1fms", func.__qualname__, elapsed * 1000
+                )
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def instrumented_logging_async(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    with t.start_as_current_span(name):
+                        if not logger.isEnabledFor(level):
+                            return await func(*args, **kwargs)
+                        logger.log(level, "Started %s", func.__name__)
+                        result = await func(*args, **kwargs)
+                        logger.log(
+                            level, "Finished %s with result %s", func.__name__, result
+                        )
+                        return result
+                finally:
+                    log_slow_call(start)
+
+            return instrumented_logging_async
+
         @wraps(func)
         def instrumented_logging(*args, **kwargs):
-            with t.start_as_current_span(name):
-                if level >= logging.getLogger().getEffectiveLevel():
-                    current_span = trace.get_current_span()
-                    current_span.add_event(
-                        f"{inspect.currentframe().f_code.co_name} span"
-                    )
-                    logging.getLogger().log(level, f"Started {func.__name__}")
+            start = time.perf_counter()
+            try:
+                with t.start_as_current_span(name):
+                    if not logger.isEnabledFor(level):
+                        return func(*args, **kwargs)
+                    logger.log(level, "Started %s", func.__name__)
                     result = func(*args, **kwargs)
-                    logging.getLogger().log(
-                        level, f"Finished {func.__name__} with result {result}"
+                    logger.log(
+                        level, "Finished %s with result %s", func.__name__, result
                     )
                     return result
-            return func(*args, **kwargs)
+            finally:
+                log_slow_call(start)
 
         return instrumented_logging
 
@@ -3,17 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from enum import Enum, auto
 from hashlib import sha256
-from os import environ
+from os import environ, urandom
+from time import time
 from typing import Any, Callable, Hashable, Optional, Protocol, Tuple, runtime_checkable
-from uuid import uuid4
 
 
 class LogicalClock:
     """Lamport logical clock."""
 
+    __slots__ = ("time_stamp", "uuid", "offset")
+
     def __init__(
         self,
         time_stamp: Optional[float] = None,
@@ -25,12 +26,8 @@ class LogicalClock:
         :param time_stamp:
         :param uuid:
         """
-        self.time_stamp = (
-            time_stamp
-            if time_stamp is not None
-            else datetime.timestamp(datetime.now(tz=timezone.utc))
-        )
-        self.uuid = uuid4().bytes if uuid is None else uuid
+        self.time_stamp = time_stamp if time_stamp is not None else time()
+        self.uuid = urandom(16) if uuid is None else uuid
         self.offset = float(environ.get("TIME_OFFSET", 0.0)) if not offset else offset
 
     def read(self) -> float:
@@ -45,7 +42,7 @@ class LogicalClock:
         Update the clock and return the current time stamp.
         :return: unix timestamp (clock value set)
         """
-        self.time_stamp = datetime.timestamp(datetime.now(tz=timezone.utc))
+        self.time_stamp = time()
         return self.time_stamp
 
     def is_later(self, time_stamp: float, other_time_stamp: float) -> bool:
@@ -113,7 +110,7 @@ class UpdateType(Enum):
     Removed = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Update:
     """Default class for encoding delta states."""
 
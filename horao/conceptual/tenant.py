@@ -41,6 +41,8 @@ class Tenant:
         :return: None if the claim is within tenant constraints
         :raises ValueError: if the claim exceeds tenant constraints
         """
+        if not self.constraints:
+            return None
         (
             compute_cpu_claim,
             compute_ram_claim,
@@ -79,7 +81,7 @@ class Constraint:
             [
                 s.amount
                 for s in self.storage_limits
-                if s.storage_type == StorageType.Block
+                if s.storage_type is StorageType.Block
             ]
         )
 
@@ -88,7 +90,7 @@ class Constraint:
             [
                 s.amount
                 for s in self.storage_limits
-                if s.storage_type == StorageType.Object
+                if s.storage_type is StorageType.Object
             ]
         )
 
@@ -8,6 +8,7 @@ Notes:
 import json
 import logging
 import os
+from collections import defaultdict
 from typing import Any, Dict, List, Optional
 
 import boto3  # type: ignore
@@ -63,22 +64,14 @@ class AmazonWebServicesController(BaseController):
             )
             response = client.describe_instances(Filters=self.custom_filter)
             restructured = self.enumerate_machines(client, response)
+            datacenters_by_name = {d.name: d for d in self.datacenters.keys()}
             for composed in restructured.keys():
                 dc, vpc = composed.split(":")
-                datacenter = next(
-                    iter([d for d in self.datacenters.keys() if d.name == dc]), None
-                )
+                datacenter = datacenters_by_name.get(dc)
                 if not datacenter:
-                    self.datacenters[
-                        DataCenter(
-                            dc,
-                            len(self.datacenters),
-                        )
-                    ] = []
-                    datacenter = next(
-                        iter([d for d in self.datacenters.keys() if d.name == dc]),
-                        None,
-                    )
+                    datacenter = DataCenter(dc, len(self.datacenters))
+                    self.datacenters[datacenter] = []
+                    datacenters_by_name[dc] = datacenter
                 cabinet = None
                 row_nr = 1
                 for nr, cabinets in datacenter.values():  # type: ignore
@@ -118,17 +111,18 @@ class AmazonWebServicesController(BaseController):
         :return: dict of specific VPCID key with list of Server as value
         :raises RuntimeError: if instance type not found
         """
-        restructured: Dict[str, List[Server]] = {}
+        restructured: Dict[str, List[Server]] = defaultdict(list)
         for reservation in response["Reservations"]:
-            # todo needs optimization
             # first loop to get all instance types
-            instance_types = []
-            for instance in reservation["Instances"]:
-                if instance["InstanceType"] not in instance_types:
-                    instance_types.append(instance["InstanceType"])
+            instance_types = {
+                instance["InstanceType"] for instance in reservation["Instances"]
+            }
             instance_types_response = client.descibe_instance_types(
-                InstanceTypes=instance_types, Filters=self.custom_filter
+                InstanceTypes=list(instance_types), Filters=self.custom_filter
             )
+            instance_types_by_name = {
+                i["InstanceType"]: i for i in instance_types_response["InstanceTypes"]
+            }
             # second loop to get all instances
             for instance in reservation["Instances"]:
                 placement_key = (
@@ -136,16 +130,7 @@ class AmazonWebServicesController(BaseController):
                     if not region
                     else f'AWS-{region}-{instance["Placement"]["AvailabilityZone"]}'
                 )
-                instance_type = next(
-                    iter(
-                        [
-                            i
-                            for i in instance_types_response["InstanceTypes"]
-                            if instance["InstanceType"] in i["InstanceType"]
-                        ]
-                    ),
-                    None,
-                )
+                instance_type = instance_types_by_name.get(instance["InstanceType"])
                 if not instance_type:
                     raise RuntimeError(
                         f"Instance type {instance['InstanceType']} not found for AWS EC2"
@@ -157,8 +142,7 @@ class AmazonWebServicesController(BaseController):
                             len(self.datacenters),
                         )
                     ] = []
-                if f'{placement_key}:{instance["VpcId"]}' not in restructured.keys():
-                    restructured[f'{placement_key}:{instance["VpcId"]}'] = []
+                vpc_key = f'{placement_key}:{instance["VpcId"]}'
                 cpus = []
                 for i in range(1, int(instance_type["VCpuInfo"]["ValidCores"])):
                     cpus.append(
@@ -255,17 +239,12 @@ class AmazonWebServicesController(BaseController):
                             None,
                         )
                     )
-                restructured[f'{placement_key}:{instance["VpcId"]}'].append(
+                restructured[vpc_key].append(
                     Server(
                         instance["InstanceId"],
                         instance["InstanceId"],
                         instance["InstanceType"],
-                        len(
-                            restructured[
-                                f'{instance["Placement"]["AvailabilityZone"]}:{instance["VpcId"]}'
-                            ]
-                        )
-                        + 1,
+                        len(restructured[vpc_key]) + 1,
                         cpus,
                         rams,
                         nics,
@@ -278,7 +257,7 @@ class AmazonWebServicesController(BaseController):
                         ),
                     )
                 )
-        return restructured
+        return dict(restructured)
 
     def subscribe(self):
         """Subscribe to AWS updates dynamically."""
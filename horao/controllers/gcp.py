@@ -8,12 +8,14 @@ Notes:
 from __future__ import annotations
 
 import os
+from collections import defaultdict
 
 from google.cloud import compute_v1
 
 from horao.controllers.base import BaseController
 from horao.physical.component import CPU, RAM, Accelerator, Disk
 from horao.physical.composite import Cabinet
+from horao.physical.computer import Server
 from horao.physical.network import NIC, Port
 from horao.physical.status import DeviceStatus
 
@@ -33,29 +35,19 @@ class GoogleCloudController(BaseController):
         request = compute_v1.AggregatedListInstancesRequest()
         request.project = self.project_id
         agg_list = instance_client.aggregated_list(request=request)
-        # first loop to fetch machine types
+        # first loop to index machine types by name
         mt_request = compute_v1.AggregatedListMachineTypesRequest()
         mt_agg_list = instance_client.aggregated_list(request=mt_request)
-        instance_types = []
-        # todo needs optimization
-        for zone, response in agg_list:
-            if response.instances:
-                for instance in response.instances:
-                    if self.tag not in instance.tags:
-                        continue
-                    for n, r in mt_agg_list:
-                        for mt in r.machine_types:
-                            if instance.machineType == mt.name:
-                                instance_types.append(mt)
-                                break
+        instance_types = {}
+        for _, r in mt_agg_list:
+            for mt in r.machine_types:
+                instance_types.setdefault(mt.name, mt)
 
         # second loop to fetch instances
-        restructured = {}
+        restructured = defaultdict(list)
         for zone, response in agg_list:
             if response.instances:
                 placement_key = f"GCP-{zone}"
-                if placement_key not in restructured.keys():
-                    restructured[placement_key] = []
                 for instance in response.instances:
                     if self.tag not in instance.tags:
                         continue
@@ -127,23 +119,27 @@ class GoogleCloudController(BaseController):
                                 )
                             )
                     restructured[placement_key].append(
-                        {
-                            "serial_number": instance.id,
-                            "name": instance.name,
-                            "model": instance.machineType,
-                            "number": len(restructured[placement_key]) + 1,
-                            "cpus": cpus,
-                            "rams": rams,
-                            "nics": nics,
-                            "disks": disks,
-                            "accelerators": accelerators,
-                        }
+                        Server(
+                            instance.id,
+                            instance.name,
+                            instance.machineType,
+                            len(restructured[placement_key]) + 1,
+                            cpus,
+                            rams,
+                            nics,
+                            disks,
+                            accelerators,
+                            (
+                                DeviceStatus.Up
+                                if instance.status == "RUNNING"
+                                else DeviceStatus.Down
+                            ),
+                        )
                     )
+        datacenters_by_name = {d.name: d for d in self.datacenters.keys()}
         for composed in restructured.keys():
             _, zone = composed.split("-")
-            datacenter = next(
-                iter([d for d in self.datacenters.keys() if d.name == zone]), None
-            )
+            datacenter = datacenters_by_name.get(zone)
             if not datacenter[1]:
                 datacenter[1] = [
                     Cabinet("GCP", zone, "cloud", 1, restructured[composed], [], [])
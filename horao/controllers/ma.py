@@ -6,6 +6,8 @@ Notes:
     We will treat each zone a separate DataCenter object.
 """
 import os
+from collections import defaultdict
+from typing import Dict
 
 from azure.identity import DefaultAzureCredential
 from azure.mgmt.compute import ComputeManagementClient
@@ -13,6 +15,7 @@ from azure.mgmt.compute import ComputeManagementClient
 from horao.controllers.base import BaseController
 from horao.physical.component import CPU, RAM, Accelerator, Disk
 from horao.physical.composite import Cabinet
+from horao.physical.computer import Server
 from horao.physical.network import NIC, Port
 from horao.physical.status import DeviceStatus
 
@@ -27,11 +30,28 @@ class MicrosoftAzureController(BaseController):
         if not self.tag:
             raise RuntimeError("AZURE_TAG environment variable not set")
 
+    @staticmethod
+    def device_statuses(client: ComputeManagementClient) -> Dict[str, DeviceStatus]:
+        """
+        Fetch the power state of all virtual machines with a single listing.
+        :param client: compute management client
+        :return: map of virtual machine id to DeviceStatus, Up only if running
+        """
+        statuses = {}
+        for vm in client.virtual_machines.list_all(status_only="true"):
+            view = vm.instance_view.statuses if vm.instance_view else None
+            codes = [s.code for s in view or []]
+            statuses[vm.id] = (
+                DeviceStatus.Up if "PowerState/running" in codes else DeviceStatus.Down
+            )
+        return statuses
+
     def sync(self):
         client = ComputeManagementClient(
             credential=DefaultAzureCredential(), subscription_id=self.subscription_id
         )
         vm_list = client.virtual_machines.list_all()
+        statuses = self.device_statuses(client)
         # first loop to fetch machine types
         instance_types = []
         for vm in vm_list:
@@ -39,13 +59,11 @@ class MicrosoftAzureController(BaseController):
                 continue
             instance_types.append(vm.hardware_profile.vm_size)
         # second loop to fetch instances
-        restructured = {}
+        restructured = defaultdict(list)
         for vm in vm_list:
             if self.tag not in vm.tags:
                 continue
             placement_key = f"AZURE-{vm.location}"
-            if placement_key not in restructured.keys():
-                restructured[placement_key] = []
             cpus = [
                 CPU(
                     vm.vm_id,
@@ -97,23 +115,23 @@ class MicrosoftAzureController(BaseController):
                     )
                 )
             restructured[placement_key].append(
-                {
-                    "serial_number": vm.vm_id,
-                    "name": vm.name,
-                    "model": vm.hardware_profile.vm_size,
-                    "number": len(restructured[placement_key]) + 1,
-                    "cpus": cpus,
-                    "rams": rams,
-                    "nics": nics,
-                    "disks": disks,
-                    "accelerators": accelerators,
-                }
+                Server(
+                    vm.vm_id,
+                    vm.name,
+                    vm.hardware_profile.vm_size,
+                    len(restructured[placement_key]) + 1,
+                    cpus,
+                    rams,
+                    nics,
+                    disks,
+                    accelerators,
+                    statuses.get(vm.id, DeviceStatus.Down),
+                )
             )
+        datacenters_by_name = {d.name: d for d in self.datacenters.keys()}
         for composed in restructured.keys():
             _, zone = composed.split("-")
-            datacenter = next(
-                iter([d for d in self.datacenters.keys() if d.name == zone]), None
-            )
+            datacenter = datacenters_by_name.get(zone)
             if not datacenter[1]:
                 datacenter[1] = [
                     Cabinet("AZURE", zone, "cloud", 1, restructured[composed], [], [])
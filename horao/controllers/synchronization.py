@@ -10,8 +10,10 @@ import json
 import logging
 import os
 import platform
-from datetime import datetime, timedelta
-from typing import List, Optional
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
 
 import httpx  # type: ignore
 import jwt  # type: ignore
@@ -31,6 +33,7 @@ class SynchronizePeers:
         peers: Optional[List[str]] = None,
         max_changes: Optional[int] = None,
         sync_delta: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> None:
         """
         Create instance
@@ -38,6 +41,7 @@ class SynchronizePeers:
         :param peers: list of peers
         :param max_changes: number of changes to synchronize
         :param sync_delta: interval in seconds between synchronizations
+        :param timeout: timeout in seconds for a single peer call
         """
         self.logger = logging.getLogger(__name__)
         self.logical_infrastructure = logical_infrastructure
@@ -49,6 +53,10 @@ class SynchronizePeers:
         self.sync_delta = (
             sync_delta if sync_delta else int(os.getenv("SYNC_DELTA", 300))
         )
+        self.timeout = timeout if timeout else float(os.getenv("SYNC_TIMEOUT", 5.0))
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, min(len(self.peers), int(os.getenv("SYNC_WORKERS", 8))))
+        )
         self.session = init_session()
         for dc in self.logical_infrastructure.infrastructure.keys():
             dc.add_listeners(self.synchronize)
@@ -79,21 +87,62 @@ class SynchronizePeers:
         if not timedelta_exceeded and not max_changes_exceeded:
             return None
         self.logger.debug("Synchronizing with peers")
-        for peer in self.peers:  # type: ignore
-            token = jwt.encode(
-                dict(peer=os.getenv("HOST_ID", platform.node())),
-                os.environ["PEER_SECRET"],
-                algorithm="HS256",
-            )
-            try:
-                lg = httpx.post(
-                    f"{peer}/synchronize",
-                    headers={"Peer": "true", "Authorization": f"Bearer {token}"},
-                    json=json.dumps(self.logical_infrastructure, cls=HoraoEncoder),
-                )
-                lg.raise_for_status()
-            except httpx.HTTPError as e:
-                self.logger.error(f"Error synchronizing with {peer}: {e}")
+        token = jwt.encode(
+            dict(
+                peer=os.getenv("HOST_ID", platform.node()),
+                exp=datetime.now(tz=timezone.utc)
+                + timedelta(seconds=int(os.getenv("PEER_TOKEN_TTL", 60))),
+                jti=secrets.token_urlsafe(16),
+            ),
+            os.environ["PEER_SECRET"],
+            algorithm="HS256",
+        )
+        headers = {"Peer": "true", "Authorization": f"Bearer {token}"}
+        payload = json.dumps(self.logical_infrastructure, cls=HoraoEncoder)
+        futures = [
+            self.executor.submit(self.synchronize_peer, peer, headers, payload)
+            for peer in self.peers  # type: ignore
+        ]
+        for future in futures:
+            future.result()
         self.session.save("last_sync", sync_time)
         self.logical_infrastructure.clear_changes()
         return sync_time
+
+    def synchronize_peer(
+        self, peer: str, headers: Dict[str, str], payload: str
+    ) -> None:
+        """
+        Send the serialized infrastructure to a single peer, errors are logged, not raised.
+        :param peer: peer to synchronize with
+        :param headers: request headers, including the peer token
+        :param payload: serialized logical infrastructure
+        :return: None
+        """
+        try:
+            lg = httpx.post(
+                f"{peer}/synchronize",
+                headers=headers,
+                json=payload,
+                timeout=self.timeout,
+            )
+            lg.raise_for_status()
+        except httpx.TimeoutException:
+            self.logger.error(
+                "Timeout synchronizing with %s after %s seconds", peer, self.timeout
+            )
+        except httpx.HTTPError as e:
+            self.logger.error("Error synchronizing with %s: %s", peer, e)
+
+    def close(self) -> None:
+        """
+        Shut down the worker threads used for synchronization
+        :return: None
+        """
+        self.executor.shutdown()
+
+    def __enter__(self) -> SynchronizePeers:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
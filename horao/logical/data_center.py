@@ -86,7 +86,7 @@ class DataCenter:
         :return: None
         """
         if changes:
-            if isinstance(changes, List):
+            if isinstance(changes, list):
                 self.changes.extend(changes)
             else:
                 self.changes.append(changes)  # type: ignore
@@ -124,10 +124,7 @@ class DataCenter:
 
     @instrument_class_function(name="has_key", level=logging.DEBUG)
     def has_key(self, k: int) -> bool:
-        for key, _ in self.rows.read():
-            if key == k:
-                return True
-        return False
+        return k in self.rows.read()
 
     def update(self, key: int, value: List[Cabinet]) -> None:
         if key in self.keys():
@@ -195,34 +192,33 @@ class DataCenter:
 
     @instrument_class_function(name="getitem", level=logging.DEBUG)
     def __getitem__(self, key) -> List[Cabinet]:
-        for k, v in self.rows.read().items():
-            if k == key:
-                return v
-        raise KeyError(f"Key {key} not found")
+        rows = self.rows.read()
+        if key not in rows:
+            raise KeyError(f"Key {key} not found")
+        return rows[key]
 
     @instrument_class_function(name="delitem", level=logging.DEBUG)
     def __delitem__(self, key) -> None:
-        for k, v in self.rows.read().items():
-            if k == key:
-                # remove all listeners
-                for cabinet in v:
-                    for server in cabinet.servers:
-                        server.disks.remove_listeners(self.invoke_listeners)
-                    cabinet.servers.remove_listeners(self.invoke_listeners)
-                    for chassis in cabinet.chassis:
-                        for blade in chassis.blades:
-                            for node in blade.nodes:
-                                for module in node.modules:
-                                    module.disks.remove_listeners(self.invoke_listeners)
-                                node.modules.remove_listeners(self.invoke_listeners)
-                            blade.nodes.remove_listeners(self.invoke_listeners)
-                        chassis.blades.remove_listeners(self.invoke_listeners)
-                    cabinet.chassis.remove_listeners(self.invoke_listeners)
-                    cabinet.switches.remove_listeners(self.invoke_listeners)
-                # remove the row
-                self.rows.unset(key, hash(key))
-                return
-        raise KeyError(f"Key {key} not found")
+        rows = self.rows.read()
+        if key not in rows:
+            raise KeyError(f"Key {key} not found")
+        # remove all listeners
+        for cabinet in rows[key]:
+            for server in cabinet.servers:
+                server.disks.remove_listeners(self.invoke_listeners)
+            cabinet.servers.remove_listeners(self.invoke_listeners)
+            for chassis in cabinet.chassis:
+                for blade in chassis.blades:
+                    for node in blade.nodes:
+                        for module in node.modules:
+                            module.disks.remove_listeners(self.invoke_listeners)
+                        node.modules.remove_listeners(self.invoke_listeners)
+                    blade.nodes.remove_listeners(self.invoke_listeners)
+                chassis.blades.remove_listeners(self.invoke_listeners)
+            cabinet.chassis.remove_listeners(self.invoke_listeners)
+            cabinet.switches.remove_listeners(self.invoke_listeners)
+        # remove the row
+        self.rows.unset(key, hash(key))
 
     def __repr__(self) -> str:
         return f"DataCenter({self.number}, {self.name}))"
@@ -307,12 +303,8 @@ class DataCenterNetwork:
         :param other: network to merge with
         :return: None
         """
-        for node in other.graph.nodes:
-            if node not in self.graph.nodes:
-                self.graph.add_node(node)
-        for edge in other.graph.edges:
-            if edge not in self.graph.edges:
-                self.graph.add_edge(edge[0], edge[1])
+        self.graph.add_nodes_from(other.graph.nodes - self.graph.nodes)
+        self.graph.add_edges_from(other.graph.edges - self.graph.edges)
 
     @instrument_class_function(name="add", level=logging.DEBUG)
     def add(self, network_device: NetworkDevice | Computer) -> None:
@@ -354,21 +346,19 @@ class DataCenterNetwork:
             rp.status = DeviceStatus.Up
 
         if isinstance(left, Switch) and left.uplink_ports and any(left.uplink_ports):
-            left_port = next(
-                iter([l for l in left.uplink_ports if not l.connected]), None
-            )
+            left_port = next((l for l in left.uplink_ports if not l.connected), None)
         else:
-            left_port = next(iter([l for l in left.ports if not l.connected]), None)
+            left_port = next((l for l in left.ports if not l.connected), None)
         if not left_port:
             raise ValueError(
                 f"No free ports available on {left} ({left.number}:{left.serial_number})"
             )
         if isinstance(right, NetworkDevice):
-            right_port = next(iter([r for r in right.ports if not r.connected]), None)
+            right_port = next((r for r in right.ports if not r.connected), None)
         else:
             # we assume that if it isn't a network device, it is a computer
             right_port = next(
-                iter([r for n in right.nics for r in n.ports if not r.connected]), None  # type: ignore
+                (r for n in right.nics for r in n.ports if not r.connected), None  # type: ignore
             )
         if not right_port:
             raise ValueError(
@@ -389,15 +379,15 @@ class DataCenterNetwork:
         """
         self.graph.remove_edge(left, right)
         if isinstance(left, Switch) and left.uplink_ports and any(left.uplink_ports):
-            left_port = next(iter([l for l in left.uplink_ports if l.connected]), None)
+            left_port = next((l for l in left.uplink_ports if l.connected), None)
         else:
-            left_port = next(iter([l for l in left.ports if l.connected]), None)
+            left_port = next((l for l in left.ports if l.connected), None)
         if isinstance(right, NetworkDevice):
-            right_port = next(iter([r for r in right.ports if r.connected]), None)
+            right_port = next((r for r in right.ports if r.connected), None)
         else:
             # we assume that if it isn't a network device, it is a computer
             right_port = next(
-                iter([r for n in right.nics for r in n.ports if r.connected]), None  # type: ignore
+                (r for n in right.nics for r in n.ports if r.connected), None  # type: ignore
             )
         if not left_port or not right_port:
             raise ValueError(
@@ -418,59 +408,59 @@ class DataCenterNetwork:
         n: NetworkDevice | Computer
         for n in self.graph.neighbors(device):
             if isinstance(n, Switch) and n.uplink_ports and any(n.uplink_ports):
-                left_port = next(iter([l for l in n.uplink_ports if l.connected]), None)
+                left_port = next((l for l in n.uplink_ports if l.connected), None)
             elif isinstance(n, Computer):
                 left_port = next(
-                    iter([l for ni in n.nics for l in ni if l.connected]), None  # type: ignore
+                    (l for ni in n.nics for l in ni if l.connected), None  # type: ignore
                 )
             else:
-                left_port = next(iter([l for l in n.ports if l.connected]), None)
+                left_port = next((l for l in n.ports if l.connected), None)
             if left_port:
                 left_port.status = DeviceStatus.Down
         if isinstance(device, NetworkDevice):
             for port in device.ports:
                 port.status = (
                     DeviceStatus.Down
-                    if port.status == DeviceStatus.Up
+                    if port.status is DeviceStatus.Up
                     else DeviceStatus.Up
                 )
         if isinstance(device, Switch):
             device.status = (
                 DeviceStatus.Down
-                if device.status == DeviceStatus.Up
+                if device.status is DeviceStatus.Up
                 else DeviceStatus.Up
             )
             if device.uplink_ports:
                 for port in device.uplink_ports:
                     port.status = (
                         DeviceStatus.Down
-                        if port.status == DeviceStatus.Up
+                        if port.status is DeviceStatus.Up
                         else DeviceStatus.Up
                     )
         elif isinstance(device, Router):
             device.status = (
                 DeviceStatus.Down
-                if device.status == DeviceStatus.Up
+                if device.status is DeviceStatus.Up
                 else DeviceStatus.Up
             )
             if device.wan_ports:
                 for port in device.wan_ports:
                     port.status = (
                         DeviceStatus.Down
-                        if port.status == DeviceStatus.Up
+                        if port.status is DeviceStatus.Up
                         else DeviceStatus.Up
                     )
         elif isinstance(device, Firewall):
             device.status = (
                 DeviceStatus.Down
-                if device.status == DeviceStatus.Up
+                if device.status is DeviceStatus.Up
                 else DeviceStatus.Up
             )
             if device.wan_ports:
                 for port in device.wan_ports:
                     port.status = (
                         DeviceStatus.Down
-                        if port.status == DeviceStatus.Up
+                        if port.status is DeviceStatus.Up
                         else DeviceStatus.Up
                     )
         elif isinstance(device, Computer):
@@ -478,7 +468,7 @@ class DataCenterNetwork:
                 for port in nic:
                     port.status = (
                         DeviceStatus.Down
-                        if port.status == DeviceStatus.Up
+                        if port.status is DeviceStatus.Up
                         else DeviceStatus.Up
                     )
 
@@ -520,13 +510,12 @@ class DataCenterNetwork:
         :return: None
         :raises ValueError: if network devices are not present in the graph
         """
+        nodes_by_hash: Dict[int, NetworkDevice | Computer] = {}
+        for n in self.graph.nodes:
+            nodes_by_hash.setdefault(hash(n), n)
         for left, right in graph.edges():
-            left_node = next(
-                iter([n for n in self.graph.nodes if int(hash(n)) == int(left)]), None
-            )
-            right_node = next(
-                iter([n for n in self.graph.nodes if int(hash(n)) == int(right)]), None
-            )
+            left_node = nodes_by_hash.get(int(left))
+            right_node = nodes_by_hash.get(int(right))
             if not left_node or not right_node:
                 raise ValueError("Could not find network devices in graph")
             self.link(left_node, right_node)
@@ -540,9 +529,5 @@ class DataCenterNetwork:
             return None
         graph = nx.Graph()
         for left, right in self.graph.edges():
-            if hash(left) not in graph.nodes:
-                graph.add_node(hash(left))
-            if right not in graph.nodes:
-                graph.add_node(hash(right))
             graph.add_edge(hash(left), hash(right))
         return graph
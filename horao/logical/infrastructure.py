@@ -118,7 +118,7 @@ class LogicalInfrastructure:
         """
         compute = []
         for dc, networks in self.infrastructure.items():
-            data_networks = [n for n in networks if n.network_type == NetworkType.Data]
+            data_networks = [n for n in networks if n.network_type is NetworkType.Data]
             if hsn_only:
                 data_networks = [n for n in data_networks if n.hsn]
             for network in data_networks:
@@ -154,7 +154,7 @@ class LogicalInfrastructure:
         """
         storage = []
         for dc, networks in self.infrastructure.items():
-            data_networks = [n for n in networks if n.network_type == NetworkType.Data]
+            data_networks = [n for n in networks if n.network_type is NetworkType.Data]
             if hsn_only:
                 data_networks = [n for n in data_networks if n.hsn]
             for network in data_networks:
@@ -188,11 +188,14 @@ class LogicalInfrastructure:
         Get the total infrastructure limits.
         :return: tuple of total compute CPUs, RAM (in GB), accelerators and block storage (in TB)
         """
-        total_infra_compute_cpu = sum([c.cpu * c.amount for c in self.total_compute()])
-        total_infra_compute_ram = sum([c.ram * c.amount for c in self.total_compute()])
-        total_infra_compute_accelerator = sum(
-            [c.amount for c in self.total_compute() if c.accelerator]
-        )
+        total_infra_compute_cpu = 0
+        total_infra_compute_ram = 0
+        total_infra_compute_accelerator = 0
+        for c in self.total_compute():
+            total_infra_compute_cpu += c.cpu * c.amount
+            total_infra_compute_ram += c.ram * c.amount
+            if c.accelerator:
+                total_infra_compute_accelerator += c.amount
         total_infra_storage_block = sum(
             [
                 s.amount
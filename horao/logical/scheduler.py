@@ -5,13 +5,30 @@ from __future__ import annotations
 import os
 from datetime import datetime, timedelta
 from enum import Enum, auto
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from horao.conceptual.claim import Reservation
 from horao.conceptual.tenant import Tenant
 from horao.logical.infrastructure import LogicalInfrastructure
-from horao.logical.resource import Compute, Storage
-from horao.physical.storage import StorageType
+
+
+def claimed_resources(claims: List[Reservation]) -> Tuple[int, int, int, int]:
+    """
+    Sum the resources of a set of claims in a single pass.
+    :param claims: claims to sum
+    :return: tuple of claimed compute CPUs, RAM (in GB), accelerators and block storage (in TB)
+    """
+    claimed_cpu = 0
+    claimed_ram = 0
+    claimed_accelerator = 0
+    claimed_storage_block = 0
+    for claim in claims:
+        cpu, ram, accelerator, storage_block = claim.extract()
+        claimed_cpu += cpu
+        claimed_ram += ram
+        claimed_accelerator += accelerator
+        claimed_storage_block += storage_block
+    return claimed_cpu, claimed_ram, claimed_accelerator, claimed_storage_block
 
 
 def dynamic_start_date(
@@ -43,57 +60,22 @@ def dynamic_start_date(
             c
             for cl in infrastructure.claims.values()
             for c in cl
-            if (not c.start or not reservation.end or c.start < reservation.end)
+            if isinstance(c, Reservation)
+            and (not c.start or not reservation.end or c.start < reservation.end)
             and (not c.end or c.end > current_window)
         ]
+        (
+            claimed_cpu,
+            claimed_ram,
+            claimed_accelerator,
+            claimed_storage_block,
+        ) = claimed_resources(other_claims_in_window)
         if (
-            claim_compute_cpu
-            > total_infra_compute_cpu
-            - sum(
-                [
-                    c.cpu * c.amount  # type: ignore
-                    for cc in other_claims_in_window
-                    for c in cc.resources  # type: ignore
-                    if isinstance(c, Compute)
-                ]
-            )
-            or (
-                claim_compute_ram
-                > total_infra_compute_ram
-                - sum(
-                    [
-                        c.ram * c.amount  # type: ignore
-                        for cc in other_claims_in_window
-                        for c in cc.resources  # type: ignore
-                        if isinstance(c, Compute)
-                    ]
-                )
-            )
-            or (
-                claim_compute_accelerator
-                > total_infra_compute_accelerator
-                - sum(
-                    [
-                        c.amount  # type: ignore
-                        for cc in other_claims_in_window
-                        for c in cc.resources  # type: ignore
-                        if isinstance(c, Compute) and c.accelerator
-                    ]
-                )
-            )
-            or (
-                claim_storage_block
-                > total_infra_storage_block
-                - sum(
-                    [
-                        s.amount  # type: ignore
-                        for sc in other_claims_in_window
-                        for s in sc.resources  # type: ignore
-                        if isinstance(s, Storage)
-                        and s.storage_type is StorageType.Block
-                    ]
-                )
-            )
+            claim_compute_cpu > total_infra_compute_cpu - claimed_cpu
+            or claim_compute_ram > total_infra_compute_ram - claimed_ram
+            or claim_compute_accelerator
+            > total_infra_compute_accelerator - claimed_accelerator
+            or claim_storage_block > total_infra_storage_block - claimed_storage_block
         ):
             current_window += timedelta(hours=int(os.getenv("PLANNING_INTERVAL", 1)))
             continue
@@ -155,46 +137,28 @@ class Scheduler:
                 c
                 for cl in self.infrastructure.claims.values()
                 for c in cl
-                if ((not c.start or not reservation.end) or c.start < reservation.end)
+                if isinstance(c, Reservation)
+                and ((not c.start or not reservation.end) or c.start < reservation.end)
                 and ((not c.end or not reservation.start) or c.end > reservation.start)
             ]
-            if claim_compute_cpu > total_infra_compute_cpu - sum(
-                [
-                    c.cpu * c.amount  # type: ignore
-                    for cc in other_claims
-                    for c in cc.resources  # type: ignore
-                    if isinstance(c, Compute)
-                ]
-            ):
+            (
+                claimed_cpu,
+                claimed_ram,
+                claimed_accelerator,
+                claimed_storage_block,
+            ) = claimed_resources(other_claims)
+            if claim_compute_cpu > total_infra_compute_cpu - claimed_cpu:
                 raise ValueError("Claim exceeds compute CPU infrastructure limits")
-            if claim_compute_ram > total_infra_compute_ram - sum(
-                [
-                    c.ram * c.amount  # type: ignore
-                    for cc in other_claims
-                    for c in cc.resources  # type: ignore
-                    if isinstance(c, Compute)
-                ]
-            ):
+            if claim_compute_ram > total_infra_compute_ram - claimed_ram:
                 raise ValueError("Claim exceeds compute RAM infrastructure limits")
-            if claim_compute_accelerator > total_infra_compute_accelerator - sum(
-                [
-                    c.accelerator * c.amount  # type: ignore
-                    for cc in other_claims
-                    for c in cc.resources  # type: ignore
-                    if isinstance(c, Compute)
-                ]
+            if (
+                claim_compute_accelerator
+                > total_infra_compute_accelerator - claimed_accelerator
             ):
                 raise ValueError(
                     "Claim exceeds compute accelerator infrastructure limits"
                 )
-            if claim_storage_block > total_infra_storage_block - sum(
-                [
-                    s.amount  # type: ignore
-                    for sc in other_claims
-                    for s in sc.resources  # type: ignore
-                    if isinstance(s, Storage)
-                ]
-            ):
+            if claim_storage_block > total_infra_storage_block - claimed_storage_block:
                 raise ValueError("Claim exceeds block storage infrastructure limits")
         else:
             if SchedulerFeature.DynamicStart in self.features:
@@ -388,15 +388,16 @@ class HoraoDecoder(json.JSONDecoder):
     def object_hook(obj):
         if "date" in obj:
             return datetime.strptime(obj["date"], "%Y-%m-%d")
-        if "type" in obj and obj["type"] == "Set":
+        obj_type = obj.get("type")
+        if obj_type == "Set":
             return set(obj["value"])
-        if "type" in obj and obj["type"] == "LogicalClock":
+        if obj_type == "LogicalClock":
             return LogicalClock(
                 time_stamp=obj["time_stamp"],
                 uuid=bytearray.fromhex(obj["uuid"]),
                 offset=obj["offset"],
             )
-        if "type" in obj and obj["type"] == "Update":
+        if obj_type == "Update":
             return Update(
                 clock_uuid=bytearray.fromhex(obj["clock_uuid"]),
                 time_stamp=obj["time_stamp"],
@@ -407,7 +408,7 @@ class HoraoDecoder(json.JSONDecoder):
                 writer=obj["writer"] if obj["writer"] else None,
                 name=obj["name"] if obj["name"] else None,
             )
-        if "type" in obj and obj["type"] == "ObservedRemovedSet":
+        if obj_type == "ObservedRemovedSet":
             return ObservedRemovedSet(
                 observed=(
                     json.loads(obj["observed"], cls=HoraoDecoder)
@@ -433,7 +434,7 @@ class HoraoDecoder(json.JSONDecoder):
                     json.loads(obj["clock"], cls=HoraoDecoder) if obj["clock"] else None
                 ),
             )
-        if "type" in obj and obj["type"] == "LastWriterWinsRegister":
+        if obj_type == "LastWriterWinsRegister":
             return LastWriterWinsRegister(
                 name=json.loads(obj["name"], cls=HoraoDecoder),
                 value=(
@@ -445,7 +446,7 @@ class HoraoDecoder(json.JSONDecoder):
                 last_update=obj["last_update"] if obj["last_update"] else None,
                 last_writer=obj["last_writer"] if obj["last_writer"] else None,
             )
-        if "type" in obj and obj["type"] == "LastWriterWinsMap":
+        if obj_type == "LastWriterWinsMap":
             return LastWriterWinsMap(
                 names=(
                     json.loads(obj["names"], cls=HoraoDecoder) if obj["names"] else None
@@ -459,7 +460,7 @@ class HoraoDecoder(json.JSONDecoder):
                     json.loads(obj["clock"], cls=HoraoDecoder) if obj["clock"] else None
                 ),
             )
-        if "type" in obj and obj["type"] == "Port":
+        if obj_type == "Port":
             return Port(
                 serial_number=obj["serial_number"],
                 model=obj["model"],
@@ -469,14 +470,14 @@ class HoraoDecoder(json.JSONDecoder):
                 connected=obj["connected"],
                 speed_gb=obj["speed_gb"],
             )
-        if "type" in obj and obj["type"] == "NIC":
+        if obj_type == "NIC":
             return NIC(
                 serial_number=obj["serial_number"],
                 model=obj["model"],
                 number=obj["number"],
                 ports=json.loads(obj["ports"], cls=HoraoDecoder),
             )
-        if "type" in obj and obj["type"] == "Switch":
+        if obj_type == "Switch":
             return Switch(
                 serial_number=obj["serial_number"],
                 name=obj["name"],
@@ -493,7 +494,7 @@ class HoraoDecoder(json.JSONDecoder):
                     else None
                 ),
             )
-        if "type" in obj and obj["type"] == "Router":
+        if obj_type == "Router":
             return Router(
                 serial_number=obj["serial_number"],
                 name=obj["name"],
@@ -508,7 +509,7 @@ class HoraoDecoder(json.JSONDecoder):
                     else None
                 ),
             )
-        if "type" in obj and obj["type"] == "Firewall":
+        if obj_type == "Firewall":
             return Firewall(
                 serial_number=obj["serial_number"],
                 name=obj["name"],
@@ -522,7 +523,7 @@ class HoraoDecoder(json.JSONDecoder):
                     else None
                 ),
             )
-        if "type" in obj and obj["type"] == "CPU":
+        if obj_type == "CPU":
             return CPU(
                 serial_number=obj["serial_number"],
                 model=obj["model"],
@@ -531,7 +532,7 @@ class HoraoDecoder(json.JSONDecoder):
                 cores=obj["cores"],
                 features=obj["features"] if obj["features"] else None,
             )
-        if "type" in obj and obj["type"] == "RAM":
+        if obj_type == "RAM":
             return RAM(
                 serial_number=obj["serial_number"],
                 model=obj["model"],
@@ -539,7 +540,7 @@ class HoraoDecoder(json.JSONDecoder):
                 size_gb=obj["size_gb"],
                 speed_mhz=obj["speed_mhz"] if obj["speed_mhz"] else None,
             )
-        if "type" in obj and obj["type"] == "Accelerator":
+        if obj_type == "Accelerator":
             return Accelerator(
                 serial_number=obj["serial_number"],
                 model=obj["model"],
@@ -548,14 +549,14 @@ class HoraoDecoder(json.JSONDecoder):
                 chip=obj["chip"] if obj["chip"] else None,
                 clock_speed=obj["clock_speed"] if obj["clock_speed"] else None,
             )
-        if "type" in obj and obj["type"] == "Disk":
+        if obj_type == "Disk":
             return Disk(
                 serial_number=obj["serial_number"],
                 model=obj["model"],
                 number=obj["number"],
                 size_gb=obj["size_gb"],
             )
-        if "type" in obj and obj["type"] == "Server":
+        if obj_type == "Server":
             return Server(
                 serial_number=obj["serial_number"],
                 name=obj["name"],
@@ -574,7 +575,7 @@ class HoraoDecoder(json.JSONDecoder):
                 ),
                 status=DeviceStatus(obj["status"]),
             )
-        if "type" in obj and obj["type"] == "Module":
+        if obj_type == "Module":
             return Module(
                 serial_number=obj["serial_number"],
                 name=obj["name"],
@@ -593,7 +594,7 @@ class HoraoDecoder(json.JSONDecoder):
                 ),
                 status=DeviceStatus(obj["status"]),
             )
-        if "type" in obj and obj["type"] == "Node":
+        if obj_type == "Node":
             return Node(
                 serial_number=obj["serial_number"],
                 name=obj["name"],
@@ -605,7 +606,7 @@ class HoraoDecoder(json.JSONDecoder):
                     else None
                 ),
             )
-        if "type" in obj and obj["type"] == "Blade":
+        if obj_type == "Blade":
             return Blade(
                 serial_number=obj["serial_number"],
                 name=obj["name"],
@@ -615,7 +616,7 @@ class HoraoDecoder(json.JSONDecoder):
                     json.loads(obj["nodes"], cls=HoraoDecoder) if obj["nodes"] else None
                 ),
             )
-        if "type" in obj and obj["type"] == "Chassis":
+        if obj_type == "Chassis":
             return Chassis(
                 serial_number=obj["serial_number"],
                 name=obj["name"],
@@ -632,7 +633,7 @@ class HoraoDecoder(json.JSONDecoder):
                     else None
                 ),
             )
-        if "type" in obj and obj["type"] == "Cabinet":
+        if obj_type == "Cabinet":
             return Cabinet(
                 serial_number=obj["serial_number"],
                 name=obj["name"],
@@ -654,13 +655,13 @@ class HoraoDecoder(json.JSONDecoder):
                     else None
                 ),
             )
-        if "type" in obj and obj["type"] == "DataCenter":
+        if obj_type == "DataCenter":
             return DataCenter(
                 name=obj["name"],
                 number=obj["number"],
                 rows=json.loads(obj["rows"], cls=HoraoDecoder),
             )
-        if "type" in obj and obj["type"] == "DataCenterNetwork":
+        if obj_type == "DataCenterNetwork":
             dcn = DataCenterNetwork(
                 name=obj["name"],
                 network_type=NetworkType(obj["network_type"]),
@@ -670,26 +671,26 @@ class HoraoDecoder(json.JSONDecoder):
                 dcn.add(node)
             dcn.links_from_graph(from_dict_of_dicts(json.loads(obj["graph"])))
             return dcn
-        if "type" in obj and obj["type"] == "LogicalInfrastructure":
+        if obj_type == "LogicalInfrastructure":
             tenants = json.loads(obj["tenants"], cls=HoraoDecoder)
             data_centers = json.loads(obj["data_centers"], cls=HoraoDecoder)
+            tenants_by_name = {t.name: t for t in tenants}
+            data_centers_by_name = {dc.name: dc for dc in data_centers}
             infrastructure = {}
             for k, v in json.loads(obj["infrastructure"], cls=HoraoDecoder).items():
-                data_centre = next(
-                    iter([dc for dc in data_centers if dc.name == k]), None
-                )
+                data_centre = data_centers_by_name.get(k)
                 if data_centre is None:
                     raise JSONDecodeError(f"DataCenter {k} not found", obj, 0)
                 infrastructure[data_centre] = v
             constraints = {}
             for k, v in json.loads(obj["constraints"], cls=HoraoDecoder).items():
-                tenant = next(iter([t for t in tenants if t.name == k]), None)
+                tenant = tenants_by_name.get(k)
                 if not tenant:
                     raise JSONDecodeError(f"Tenant {k} not found", obj, 0)
                 constraints[tenant] = v
             claims = {}
             for k, v in json.loads(obj["claims"], cls=HoraoDecoder).items():
-                tenant = next(iter([t for t in tenants if t.name == k]), None)
+                tenant = tenants_by_name.get(k)
                 if not tenant:
                     raise JSONDecodeError(f"Tenant {k} not found", obj, 0)
                 claims[tenant] = v
@@ -698,36 +699,36 @@ class HoraoDecoder(json.JSONDecoder):
                 constraints=constraints,
                 claims=claims,
             )
-        if "type" in obj and obj["type"] == "Storage":
+        if obj_type == "Storage":
             return Storage(
                 capacity=obj["capacity"],
                 storage_type=StorageType(obj["storage_type"]),
                 storage_class=obj["storage_class"],
             )
-        if "type" in obj and obj["type"] == "Compute":
+        if obj_type == "Compute":
             return Compute(
                 cpu=obj["cpu"],
                 ram=obj["ram"],
                 accelerator=obj["accelerator"],
                 amount=obj["amount"],
             )
-        if "type" in obj and obj["type"] == "Constraint":
+        if obj_type == "Constraint":
             return Constraint(
                 compute_limits=json.loads(obj["compute_limits"], cls=HoraoDecoder),
                 storage_limits=json.loads(obj["storage_limits"], cls=HoraoDecoder),
             )
-        if "type" in obj and obj["type"] == "TenantController":
+        if obj_type == "TenantController":
             return TenantController(
                 name=obj["name"],
                 tenants=json.load(obj["tenants"]) if obj["tenants"] else None,
             )
-        if "type" in obj and obj["type"] == "Tenant":
+        if obj_type == "Tenant":
             return Tenant(
                 name=obj["name"],
                 owner=obj["owner"],
                 constraints=json.loads(obj["constraints"], cls=HoraoDecoder),
             )
-        if "type" in obj and obj["type"] == "Reservation":
+        if obj_type == "Reservation":
             return Reservation(
                 name=obj["name"],
                 start=obj["start"],
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-#
 """Storage abstraction."""
+import asyncio
 import json
 import logging
+import time
 from typing import Any, Dict, Optional
 
 from redis import Redis as Redis
@@ -56,23 +58,29 @@ class Store:
     async def load_logical_infrastructure(self) -> LogicalInfrastructure:
         """
         Load the logical infrastructure from the store
+        each structure and its content are fetched concurrently
         :return: LogicalInfrastructure
         """
         infrastructure = {}
         claims = {}
         constraints = {}
         for key in await self.keys():
+            if key.endswith(".content"):
+                continue
             if key.startswith("datacenter-"):
-                dc = await self.async_load(key)
-                content = await self.async_load(f"datacenter-{key}.content")
+                dc, content = await asyncio.gather(
+                    self.async_load(key), self.async_load(f"{key}.content")
+                )
                 infrastructure[dc] = content
             elif key.startswith("claim-"):
-                claim = await self.async_load(key)
-                content = await self.async_load(f"claim-{key}.content")
+                claim, content = await asyncio.gather(
+                    self.async_load(key), self.async_load(f"{key}.content")
+                )
                 claims[claim] = content
             elif key.startswith("constraint-"):
-                constraint = await self.async_load(key)
-                content = await self.async_load(f"constraint-{key}.content")
+                constraint, content = await asyncio.gather(
+                    self.async_load(key), self.async_load(f"{key}.content")
+                )
                 constraints[constraint] = content
         return LogicalInfrastructure(infrastructure, constraints, claims)
 
@@ -81,28 +89,71 @@ class Store:
     ) -> None:
         """
         Save the logical infrastructure to the store
+        independent loads and saves are issued concurrently
         :param logical_infrastructure: infrastructure to save
         :return: None
         """
         for k, v in logical_infrastructure.infrastructure.items():
-            local_dc = await self.async_load(k.name)
-            if not local_dc:
-                await self.async_save(f"datacenter-{k.name}", k)
-            else:
+            key = f"datacenter-{k.name}"
+            local_dc, local_dc_content = await asyncio.gather(
+                self.async_load(key), self.async_load(f"{key}.content")
+            )
+            if local_dc:
                 local_dc.merge(k)
-            local_dc_content = await self.async_load(f"datacenter-{k.name}.content")
-            if not local_dc_content:
-                await self.async_save(f"datacenter-{k.name}.content", v)
             else:
-                local_dc_content.merge(v)
+                local_dc = k
+            if local_dc_content:
+                for network in v:
+                    if network in local_dc_content:
+                        local = local_dc_content[local_dc_content.index(network)]
+                        local.merge(network)
+                    else:
+                        local_dc_content.append(network)
+            else:
+                local_dc_content = v
+            await asyncio.gather(
+                self.async_save(key, local_dc),
+                self.async_save(f"{key}.content", local_dc_content),
+            )
         if logical_infrastructure.claims:
-            for k, v in logical_infrastructure.claims.items():  # type: ignore
-                await self.async_save(f"claim-{k.name}", k)
-                await self.async_save(f"claim-{k.name}.content", v)
+            await asyncio.gather(
+                *[
+                    self.async_save(f"claim-{k.name}", k)
+                    for k in logical_infrastructure.claims.keys()  # type: ignore
+                ],
+                *[
+                    self.async_save(f"claim-{k.name}.content", v)
+                    for k, v in logical_infrastructure.claims.items()  # type: ignore
+                ],
+            )
         if logical_infrastructure.constraints:
-            for k, v in logical_infrastructure.constraints.items():  # type: ignore
-                await self.async_save(f"constraint-{k.name}", k)
-                await self.async_save(f"constraint-{k.name}.content", v)
+            await asyncio.gather(
+                *[
+                    self.async_save(f"constraint-{k.name}", k)
+                    for k in logical_infrastructure.constraints.keys()  # type: ignore
+                ],
+                *[
+                    self.async_save(f"constraint-{k.name}.content", v)
+                    for k, v in logical_infrastructure.constraints.items()  # type: ignore
+                ],
+            )
+
+    async def async_claim(self, key: str, expires: float) -> bool:
+        """
+        Claim a key until it expires, a claimed key cannot be claimed again before then
+        :param key: key to claim
+        :param expires: expiry of the claim (seconds since epoch)
+        :return: True if the key was claimed, False if it was already claimed
+        """
+        if hasattr(self, "redis"):
+            return bool(
+                await self.redis_aio.set(key, expires, nx=True, exat=int(expires) + 1)
+            )
+        claimed = self.memory.get(key)
+        if claimed is not None and json.loads(claimed) >= time.time():
+            return False
+        self.memory[key] = json.dumps(expires)
+        return True
 
     @instrument_class_function(name="async_load", level=logging.DEBUG)
     async def async_load(self, key: str) -> Any | None:
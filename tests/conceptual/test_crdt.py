@@ -1,5 +1,7 @@
 from itertools import permutations
 
+import pytest
+
 from horao.conceptual.crdt import (
     LastWriterWinsMap,
     LastWriterWinsRegister,
@@ -413,6 +415,20 @@ def test_lww_map_read_after_unset_is_correct():
     assert name not in view2
 
 
+def test_lww_map_cache_is_reset_upon_update():
+    lww_map = LastWriterWinsMap()
+    lww_map.set("foo", "bar", 1)
+    assert lww_map.cache is None
+    view = lww_map.read()
+    assert lww_map.cache is not None
+    with pytest.raises(TypeError):
+        view["foo"] = "corrupted"  # type: ignore
+    assert lww_map.read()["foo"] == "bar"
+    lww_map.set("foo", "baz", 1)
+    assert lww_map.cache is None
+    assert lww_map.read()["foo"] == "baz"
+
+
 def test_lww_map_concurrent_writes_bias_to_higher_writer():
     lww_map = LastWriterWinsMap()
     lww_map2 = LastWriterWinsMap()
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from horao.conceptual.decorators import instrument_class_function
+
+
+class Instrumented:
+    @instrument_class_function(name="slow", slow_call_threshold=0.01)
+    def slow(self):
+        time.sleep(0.02)
+        return True
+
+    @instrument_class_function(name="fast", slow_call_threshold=0.01)
+    def fast(self):
+        return True
+
+    @instrument_class_function(name="slow_async", slow_call_threshold=0.01)
+    async def slow_async(self):
+        await asyncio.sleep(0.02)
+        return True
+
+    @instrument_class_function(name="default")
+    def default(self):
+        time.sleep(0.06)
+        return True
+
+    @instrument_class_function(name="debug", level=logging.DEBUG)
+    def debug(self):
+        return True
+
+
+def test_slow_call_is_logged_as_warning(caplog):
+    caplog.set_level(logging.WARNING)
+    instrumented = Instrumented()
+    assert instrumented.fast()
+    assert not [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert instrumented.slow()
+    assert "Slow call Instrumented.slow" in caplog.text
+
+
+def test_calls_are_only_logged_when_level_is_enabled(caplog):
+    caplog.set_level(logging.INFO)
+    instrumented = Instrumented()
+    assert instrumented.debug()
+    assert "Started debug" not in caplog.text
+    caplog.set_level(logging.DEBUG)
+    assert instrumented.debug()
+    assert "Started debug" in caplog.text
+    assert "Finished debug with result True" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_slow_coroutine_is_timed_until_completion(caplog):
+    caplog.set_level(logging.WARNING)
+    instrumented = Instrumented()
+    assert await instrumented.slow_async()
+    assert "Slow call Instrumented.slow_async" in caplog.text
+
+
+def test_slow_call_warning_is_disabled_by_default(caplog):
+    caplog.set_level(logging.WARNING)
+    instrumented = Instrumented()
+    assert instrumented.default()
+    assert not [r for r in caplog.records if r.levelno == logging.WARNING]
@@ -7,8 +7,10 @@ import pytest
 from horao.conceptual.claim import Reservation
 from horao.conceptual.tenant import Constraint, Tenant
 from horao.logical.infrastructure import Compute, LogicalInfrastructure
-from horao.logical.scheduler import Scheduler, SchedulerFeature
+from horao.logical.resource import Storage
+from horao.logical.scheduler import Scheduler, SchedulerFeature, claimed_resources
 from horao.physical.network import NetworkTopology
+from horao.physical.storage import StorageClass, StorageType
 from tests.helpers import initialize_logical_infrastructure
 
 
@@ -29,6 +31,26 @@ def test_extract_claim_details():
     assert claim.extract() == (4, 4, 0, 0)
 
 
+def test_claimed_resources_are_summed_over_claims():
+    start = datetime.now() + timedelta(hours=1)
+    end = datetime.now() + timedelta(days=1)
+    claims = [
+        Reservation(
+            name="first",
+            resources=[Compute(4, 4, False, 1)],
+            start=start,
+            end=end,
+        ),
+        Reservation(
+            name="second",
+            resources=[Compute(2, 8, True, 2)],
+            start=start,
+            end=end,
+        ),
+    ]
+    assert claimed_resources(claims) == (8, 20, 2, 0)
+
+
 def test_tenant_constraints():
     constraint = Constraint([Compute(1, 1, False, 1)], [])
     tenant = Tenant("test1", "owner", constraints=[constraint])
@@ -114,3 +136,26 @@ def test_claim_is_scheduled_when_enough_capacity_exists_in_time():
         scheduler.schedule(claim2, tenant)
     scheduler = Scheduler(infrastructure, [SchedulerFeature.DynamicStart])
     assert scheduler.schedule(claim2, tenant) >= end
+
+
+def test_only_block_storage_claims_count_against_block_storage_limit():
+    dc, dcn = initialize_logical_infrastructure()
+    infrastructure = LogicalInfrastructure({dc: [dcn]})
+    scheduler = Scheduler(infrastructure)
+    tenant = Tenant("test5", "owner")
+    start = datetime.now() + timedelta(hours=1)
+    end = datetime.now() + timedelta(days=1)
+    object_claim = Reservation(
+        name="test5-object",
+        start=start,
+        resources=[Storage(10, StorageType.Object, StorageClass.Hot)],
+        end=end,
+    )
+    compute_claim = Reservation(
+        name="test5-compute",
+        start=start,
+        resources=[Compute(4, 4, False, 1)],
+        end=end,
+    )
+    assert scheduler.schedule(object_claim, tenant) == start
+    assert scheduler.schedule(compute_claim, tenant) == start
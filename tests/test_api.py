@@ -1,17 +1,36 @@
 # -*- coding: utf-8 -*-#
 import json
 import os
+import secrets
+import time
+from datetime import datetime, timedelta, timezone
 
 import jwt
+import pytest
+from jwt.utils import base64url_decode, base64url_encode
 from starlette.testclient import TestClient
 
 from horao import init
+from horao.auth.error import UnauthorizedError
+from horao.auth.multi import MultiAuthBackend
 from horao.logical.infrastructure import LogicalInfrastructure
 from horao.persistance import HoraoEncoder
 from tests.basic_auth import BasicAuthBackend, basic_auth
 from tests.helpers import initialize_logical_infrastructure
 
 
+def peer_token(peer: str) -> str:
+    return jwt.encode(
+        dict(
+            peer=peer,
+            exp=datetime.now(tz=timezone.utc) + timedelta(seconds=60),
+            jti=secrets.token_urlsafe(16),
+        ),
+        os.environ["PEER_SECRET"],
+        algorithm="HS256",
+    )
+
+
 def test_ping_service_unauthorized():
     os.environ["TELEMETRY"] = "OFF"
     ia = init(BasicAuthBackend())
@@ -30,6 +49,18 @@ def test_ping_service_authorized():
         assert 200 == lg.status_code
 
 
+def test_write_permission_is_not_granted_by_read_permission():
+    os.environ["TELEMETRY"] = "OFF"
+    ia = init(BasicAuthBackend())
+    with TestClient(ia) as client:
+        with pytest.raises(UnauthorizedError):
+            client.post(
+                "/reservation",
+                headers={"Authorization": basic_auth("admin", "secret3")},
+                json="{}",
+            )
+
+
 def test_synchronize_simple_structure():
     os.environ["DEBUG"] = "True"
     os.environ["TELEMETRY"] = "OFF"
@@ -38,7 +69,7 @@ def test_synchronize_simple_structure():
     os.environ["PEER_SECRET"] = "secret"
     dc, dcn = initialize_logical_infrastructure()
     infrastructure = LogicalInfrastructure({dc: [dcn]})
-    token = jwt.encode(dict(peer="1"), os.environ["PEER_SECRET"], algorithm="HS256")
+    token = peer_token("1")
     ia = init()
     with TestClient(ia) as client:
         lg = client.post("/synchronize")
@@ -49,3 +80,61 @@ def test_synchronize_simple_structure():
             json=json.dumps(infrastructure, cls=HoraoEncoder),
         )
         assert 200 == lg.status_code
+
+
+def test_synchronize_replayed_token_is_rejected():
+    os.environ["TELEMETRY"] = "OFF"
+    os.environ["PEER_STRICT"] = "False"
+    os.environ["PEERS"] = "1,2"
+    os.environ["PEER_SECRET"] = "secret"
+    dc, dcn = initialize_logical_infrastructure()
+    infrastructure = LogicalInfrastructure({dc: [dcn]})
+    token = peer_token("1")
+    ia = init()
+    with TestClient(ia) as client:
+        lg = client.post(
+            "/synchronize",
+            headers={"Peer": "true", "Authorization": f"Bearer {token}"},
+            json=json.dumps(infrastructure, cls=HoraoEncoder),
+        )
+        assert 200 == lg.status_code
+        lg = client.post(
+            "/synchronize",
+            headers={"Peer": "true", "Authorization": f"Bearer {token}"},
+            json=json.dumps(infrastructure, cls=HoraoEncoder),
+        )
+        assert 400 == lg.status_code
+
+
+def test_synchronize_tampered_token_is_rejected():
+    os.environ["TELEMETRY"] = "OFF"
+    os.environ["PEER_STRICT"] = "False"
+    os.environ["PEERS"] = "1,2"
+    os.environ["PEER_SECRET"] = "secret"
+    dc, dcn = initialize_logical_infrastructure()
+    infrastructure = LogicalInfrastructure({dc: [dcn]})
+    token = peer_token("1")
+    header, payload, signature = token.split(".")
+    raw = bytearray(base64url_decode(signature))
+    raw[secrets.randbelow(len(raw))] ^= 1 << secrets.randbelow(8)
+    tampered = f"{header}.{payload}.{base64url_encode(bytes(raw)).decode()}"
+    ia = init()
+    with TestClient(ia) as client:
+        lg = client.post(
+            "/synchronize",
+            headers={"Peer": "true", "Authorization": f"Bearer {tampered}"},
+            json=json.dumps(infrastructure, cls=HoraoEncoder),
+        )
+        assert 400 == lg.status_code
+
+
+@pytest.mark.asyncio
+async def test_peer_tokens_are_rejected_when_token_cache_is_full():
+    os.environ.pop("REDIS_URL", None)
+    backend = MultiAuthBackend()
+    backend.seen_tokens_size = 1
+    assert await backend.register_token("first", time.time() + 60)
+    assert not await backend.register_token("second", time.time() + 60)
+    assert not await backend.register_token("first", time.time() + 60)
+    backend.seen_tokens["first"] = time.time() - 1
+    assert await backend.register_token("second", time.time() + 60)
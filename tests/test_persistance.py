@@ -1,4 +1,5 @@
 import json
+import time
 
 import pytest
 
@@ -190,3 +191,24 @@ async def test_storing_loading_logical_infrastructure():
     await store.async_save("infrastructure", infrastructure)
     loaded_infrastructure = await store.async_load("infrastructure")
     assert infrastructure == loaded_infrastructure
+
+
+@pytest.mark.asyncio
+async def test_saved_logical_infrastructure_is_merged_and_loaded():
+    dc, dcn = initialize_logical_infrastructure()
+    infrastructure = LogicalInfrastructure({dc: [dcn]})
+    store = Store(None)
+    await store.save_logical_infrastructure(infrastructure)
+    await store.save_logical_infrastructure(infrastructure)
+    assert f"datacenter-{dc.name}" in await store.keys()
+    loaded_infrastructure = await store.load_logical_infrastructure()
+    assert infrastructure == loaded_infrastructure
+
+
+@pytest.mark.asyncio
+async def test_claimed_key_cannot_be_claimed_again_until_expired():
+    store = Store(None)
+    assert await store.async_claim("token", time.time() + 60)
+    assert not await store.async_claim("token", time.time() + 60)
+    assert await store.async_claim("expired", time.time() - 1)
+    assert await store.async_claim("expired", time.time() + 60)
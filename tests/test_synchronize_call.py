@@ -1,9 +1,12 @@
+import logging
 import os
+import threading
 import time
 from datetime import datetime
 
 import pytest
 from pytest_httpserver import HTTPServer
+from werkzeug import Response
 
 from horao.conceptual.support import Update
 from horao.controllers.synchronization import SynchronizePeers
@@ -91,3 +94,107 @@ def test_backpressure_stacked():
         ),
         datetime,
     )
+
+
+def test_peer_timeout_does_not_block(httpserver: HTTPServer, caplog):
+    def slow_handler(_):
+        time.sleep(0.5)
+        return Response("OK")
+
+    httpserver.expect_request("/synchronize").respond_with_handler(slow_handler)
+    os.environ["DEBUG"] = "True"
+    os.environ["TELEMETRY"] = "OFF"
+    os.environ["PEER_STRICT"] = "False"
+    os.environ["PEERS"] = "http://localhost:9999"
+    os.environ["PEER_SECRET"] = "secret"
+    dc, dcn = initialize_logical_infrastructure()
+    infrastructure = LogicalInfrastructure(infrastructure={dc: [dcn]})
+    sync_peers = SynchronizePeers(infrastructure, timeout=0.1)
+    caplog.set_level(logging.ERROR)
+    start = time.monotonic()
+    assert isinstance(
+        sync_peers.synchronize([Update(b"1", 1.1, None, None, None, None)]), datetime
+    )
+    assert time.monotonic() - start < 0.4
+    assert any(
+        r.levelno == logging.ERROR
+        and r.getMessage().startswith("Timeout synchronizing")
+        for r in caplog.records
+    )
+
+
+def test_peers_are_synchronized_concurrently():
+    def slow_handler(_):
+        time.sleep(0.5)
+        return Response("OK")
+
+    server = HTTPServer(threaded=True)
+    server.expect_request("/synchronize").respond_with_handler(slow_handler)
+    server.start()
+    try:
+        os.environ["DEBUG"] = "True"
+        os.environ["TELEMETRY"] = "OFF"
+        os.environ["PEER_STRICT"] = "False"
+        os.environ["PEERS"] = ",".join([server.url_for("").rstrip("/")] * 3)
+        os.environ["PEER_SECRET"] = "secret"
+        dc, dcn = initialize_logical_infrastructure()
+        infrastructure = LogicalInfrastructure(infrastructure={dc: [dcn]})
+        sync_peers = SynchronizePeers(infrastructure, timeout=5)
+        start = time.perf_counter()
+        assert isinstance(
+            sync_peers.synchronize([Update(b"1", 1.1, None, None, None, None)]),
+            datetime,
+        )
+        assert time.perf_counter() - start < 1.5
+        assert len(server.log) == 3
+        server.check_assertions()
+    finally:
+        server.clear()
+        server.stop()
+
+
+def test_synchronization_workers_are_capped_and_reused():
+    lock = threading.Lock()
+    active = [0]
+    peak = [0]
+
+    def counting_handler(_):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.2)
+        with lock:
+            active[0] -= 1
+        return Response("OK")
+
+    server = HTTPServer(threaded=True)
+    server.expect_request("/synchronize").respond_with_handler(counting_handler)
+    server.start()
+    try:
+        os.environ["DEBUG"] = "True"
+        os.environ["TELEMETRY"] = "OFF"
+        os.environ["PEER_STRICT"] = "False"
+        os.environ["PEERS"] = ",".join([server.url_for("").rstrip("/")] * 4)
+        os.environ["PEER_SECRET"] = "secret"
+        os.environ["SYNC_WORKERS"] = "2"
+        dc, dcn = initialize_logical_infrastructure()
+        infrastructure = LogicalInfrastructure(infrastructure={dc: [dcn]})
+        with SynchronizePeers(infrastructure, max_changes=1, timeout=5) as sync_peers:
+            executor = sync_peers.executor
+            for _ in range(2):
+                assert isinstance(
+                    sync_peers.synchronize(
+                        [
+                            Update(b"1", 1.1, None, None, None, None),
+                            Update(b"2", 1.1, None, None, None, None),
+                        ]
+                    ),
+                    datetime,
+                )
+            assert sync_peers.executor is executor
+        assert len(server.log) == 8
+        assert peak[0] == 2
+    finally:
+        os.environ.pop("SYNC_WORKERS", None)
+        server.clear()
+        server.stop()